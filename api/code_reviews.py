@@ -1,55 +1,176 @@
 """Code review fetching functions"""
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from github.PullRequest import PullRequest
+from github.PullRequestReview import PullRequestReview
+
+from api import detail_cache
+from api import search_cache
+from api.graphql_client import fetch_pull_requests_batch
+from api.pull_requests import fetch_pull_request_details
+from api.search import iter_search_issues
+from utils.date_utils import format_iso_utc
+from api.repositories import get_repo_cached
+from config.constants import MAX_CONCURRENT_FETCHES
+from utils.text_utils import to_single_line
+
+# Extracts (owner, repo, number) from a PR html_url, compiled once
+# instead of per search hit
+PR_URL_PATTERN = re.compile(r".*/([^/]+)/([^/]+)/pull/(\d+)")
+
 
 def transform_code_review(review, pr):
-    """Transform raw review data to our format"""
+    """
+    Transform raw review data to our format
+
+    Reads the raw JSON payloads directly instead of traversing PyGithub's
+    object graph, so no attribute access can trigger a lazy re-fetch
+    (dates arrive as ISO 8601 "Z" strings, no reformatting needed)
+    """
+    review_data = review._rawData
+    pr_data = pr._rawData
+
     # Extract owner/repo from PR data
-    owner = pr.base.repo.owner.login
-    repo = pr.base.repo.name
-    
+    base_repo = (pr_data.get("base") or {}).get("repo") or {}
+    owner = (base_repo.get("owner") or {}).get("login", "")
+    repo = base_repo.get("name", "")
+    reviewer = review_data.get("user") or {}
+
     # Sanitize review body to single line
-    body = (review.body or "").replace("\n", " ").replace("\r", " ").strip()
-    
+    body = to_single_line(review_data.get("body"))
+
     return {
         "type": "code-review",
-        "review_id": review.id,
-        "state": review.state,  # APPROVED, CHANGES_REQUESTED, COMMENTED, DISMISSED
-        "submitted_at": review.submitted_at.isoformat().replace("+00:00", "Z") if review.submitted_at else "",
-        "pr_number": pr.number,
-        "pr_title": (pr.title or "").replace("\n", " ").replace("\r", " ").strip(),
+        "review_id": review_data.get("id"),
+        "state": review_data.get("state", ""),  # APPROVED, CHANGES_REQUESTED, COMMENTED, DISMISSED
+        "submitted_at": review_data.get("submitted_at") or "",
+        "pr_number": pr_data.get("number"),
+        "pr_title": to_single_line(pr_data.get("title")),
         "repo": f"{owner}/{repo}",
         "repo_owner": owner,
         "repo_name": repo,
-        "reviewer_name": review.user.login if review.user else "",
+        "reviewer_name": reviewer.get("login", ""),
         "review_body": body,
-        "pr_url": pr.html_url,
-        "review_url": review.html_url,
-        "commit_id": review.commit_id,
+        "pr_url": pr_data.get("html_url", ""),
+        "review_url": review_data.get("html_url", ""),
+        "commit_id": review_data.get("commit_id") or "",
     }
 
 
 def fetch_pull_request_reviews(github_client, owner, repo, pr_number):
-    """Fetch reviews for a specific pull request"""
+    """
+    Fetch reviews for a specific pull request
+
+    Returns a lazily-paginated iterable: pages are fetched on demand as
+    the caller consumes reviews instead of being materialized up front
+    """
     try:
-        repository = github_client.get_repo(f"{owner}/{repo}")
+        repository = get_repo_cached(github_client, f"{owner}/{repo}")
         pr = repository.get_pull(pr_number)
-        return list(pr.get_reviews())
+        return pr.get_reviews()
     except Exception as error:
         print(f"  Warning: Could not fetch reviews for {owner}/{repo}#{pr_number}: {error}")
         return []
 
 
-def fetch_pull_request_details(github_client, owner, repo, pr_number):
-    """Fetch full PR details to get complete information"""
+def _rehydrate_pr_and_reviews(github_client, pr_raw, reviews_raw):
+    """Build PyGithub objects from raw PR and review dictionaries"""
+    full_pr = github_client.create_from_raw_data(PullRequest, pr_raw)
+    reviews = [
+        github_client.create_from_raw_data(PullRequestReview, raw)
+        for raw in reviews_raw
+    ]
+    return full_pr, reviews
+
+
+def _fetch_pr_and_reviews_rest(github_client, owner, repo, pr_number, cache):
+    """Fetch PR details and reviews over REST, populating the cache"""
+    full_pr = fetch_pull_request_details(github_client, owner, repo, pr_number)
+    if not full_pr:
+        return None, []
+    # The review listing paginates lazily, so page-fetch errors surface
+    # here during consumption, not inside fetch_pull_request_reviews;
+    # keep the warn-and-skip-one-PR contract rather than letting the
+    # error abort the whole run
     try:
-        repository = github_client.get_repo(f"{owner}/{repo}")
-        pr = repository.get_pull(pr_number)
-        return pr
+        reviews = list(fetch_pull_request_reviews(github_client, owner, repo, pr_number))
     except Exception as error:
-        print(f"  Warning: Could not fetch details for {owner}/{repo}#{pr_number}: {error}")
-        return None
+        print(f"  Warning: Could not fetch reviews for {owner}/{repo}#{pr_number}: {error}")
+        return full_pr, []
+    detail_cache.put_cached(
+        cache,
+        owner,
+        repo,
+        pr_number,
+        full_pr.raw_data,
+        [review.raw_data for review in reviews],
+    )
+    return full_pr, reviews
+
+
+def _resolve_prs_with_reviews(github_client, pr_refs, cache):
+    """
+    Resolve PR details and reviews for all refs with as few requests as possible
+
+    Resolution order: on-disk cache, then batched GraphQL queries (one
+    request per 40 PRs, reviews folded into the same query, instead of
+    two REST calls per PR), then a bounded concurrent REST fallback for
+    anything GraphQL could not resolve
+
+    Each ref carries the search hit's updated_at; cache entries older
+    than it are treated as misses, so a PR that re-surfaced because it
+    changed (e.g. a new review on a closed PR) is always re-fetched
+    instead of being served its pre-change review list
+
+    Args:
+        github_client: Authenticated GitHub client
+        pr_refs: List of (owner, repo, pr_number, updated_at) tuples
+        cache: Detail cache dictionary
+
+    Returns:
+        List of (PullRequest, reviews) tuples aligned with pr_refs;
+        (None, []) for PRs that could not be resolved
+    """
+    resolved = [None] * len(pr_refs)
+
+    to_fetch = []
+    for i, (owner, repo, pr_number, updated_at) in enumerate(pr_refs):
+        entry = detail_cache.get_cached(cache, owner, repo, pr_number, updated_at)
+        if entry is not None and entry.get("reviews") is not None:
+            resolved[i] = _rehydrate_pr_and_reviews(
+                github_client, entry["pull_request"], entry["reviews"]
+            )
+        else:
+            to_fetch.append(i)
+
+    if to_fetch:
+        batch = fetch_pull_requests_batch(
+            github_client,
+            [pr_refs[i][:3] for i in to_fetch],
+            include_reviews=True,
+        )
+        for i, (pr_raw, reviews_raw) in zip(to_fetch, batch):
+            if pr_raw is not None:
+                owner, repo, pr_number, _updated_at = pr_refs[i]
+                detail_cache.put_cached(cache, owner, repo, pr_number, pr_raw, reviews_raw)
+                resolved[i] = _rehydrate_pr_and_reviews(github_client, pr_raw, reviews_raw)
+
+    # REST fallback for anything the batched queries could not resolve
+    missing = [i for i in to_fetch if resolved[i] is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            fetched = executor.map(
+                lambda i: _fetch_pr_and_reviews_rest(
+                    github_client, pr_refs[i][0], pr_refs[i][1], pr_refs[i][2], cache
+                ),
+                missing,
+            )
+            for i, result in zip(missing, fetched):
+                resolved[i] = result
+
+    return [result if result is not None else (None, []) for result in resolved]
 
 
 def search_user_code_reviews(github_client, username, since_date=None, show_sample=False):
@@ -76,41 +197,62 @@ def search_user_code_reviews(github_client, username, since_date=None, show_samp
         if since_date:
             date_str = since_date.split("T")[0]
             query += f" created:>={date_str}"
-        
+
+        # Resume from the last run's checkpoint so incremental runs only
+        # scan PRs touched since then instead of the full history. The
+        # checkpoint windows on updated_at, not created_at: a review can
+        # land on an old PR at any time, but submitting it bumps the
+        # PR's updated_at, so an updated:>= window always re-surfaces it
+        checkpoint_store = search_cache.load_cache()
+        checkpoint_key = search_cache.entry_key("code-reviews", username, since_date)
+        checkpoint = checkpoint_store.get(checkpoint_key) or {}
+        cached_rows = checkpoint.get("rows") or []
+        last_updated = checkpoint.get("last_updated") or ""
+        if last_updated:
+            query += f" updated:>={last_updated}"
+
         print(f"\n🔍 Searching code reviews with query: \"{query}\"")
-        
-        # Search API returns max 1000 results
-        search_results = github_client.search_issues(query, sort="created", order="desc")
-        
-        all_reviews = []
-        processed = 0
-        
+
+        # Ascending order streams oldest-first, so the last processed
+        # item is always a valid resume checkpoint; iter_search_issues
+        # re-windows the query past the Search API's 1000-result cap
+        search_results = iter_search_issues(github_client, query, sort="updated")
+
+        # Collect (owner, repo, number) references first so the detail and
+        # review fetches can run concurrently instead of one RTT per iteration
+        pr_refs = []
         for issue in search_results:
             if not issue.pull_request:
                 continue
-            
+
             # Extract owner/repo from URL
-            match = re.match(r".*/([^/]+)/([^/]+)/pull/(\d+)", issue.html_url)
+            match = PR_URL_PATTERN.match(issue.html_url)
             if not match:
                 print(f"  Warning: Could not parse PR URL: {issue.html_url}")
                 continue
-            
+
             owner, repo, pr_number = match.groups()
-            
-            # Fetch full PR details for complete information
-            full_pr = fetch_pull_request_details(github_client, owner, repo, int(pr_number))
+            pr_refs.append((owner, repo, int(pr_number), issue.updated_at))
+            if issue.updated_at:
+                last_updated = format_iso_utc(issue.updated_at)
+
+        cache = detail_cache.load_cache()
+
+        all_reviews = []
+        processed = 0
+
+        # Resolve PR details + reviews via cache + batched GraphQL (REST fallback)
+        for resolved in _resolve_prs_with_reviews(github_client, pr_refs, cache):
+            full_pr, reviews = resolved
             if not full_pr:
                 continue
-            
-            # Fetch all reviews for this PR
-            reviews = fetch_pull_request_reviews(github_client, owner, repo, int(pr_number))
-            
+
             # Filter reviews by the target user and exclude dismissed reviews
             user_reviews = [
                 review for review in reviews
                 if review.user and review.user.login == username and review.state != "DISMISSED"
             ]
-            
+
             # Apply date filter if provided
             if since_date:
                 since = datetime.fromisoformat(since_date.replace("Z", "+00:00"))
@@ -118,22 +260,35 @@ def search_user_code_reviews(github_client, username, since_date=None, show_samp
                     review for review in user_reviews
                     if review.submitted_at and review.submitted_at >= since
                 ]
-            
+
             # Transform and add to results
             for review in user_reviews:
                 all_reviews.append(transform_code_review(review, full_pr))
-            
+
             processed += 1
             if processed % 10 == 0:
                 print(f"  Processed {processed} PRs...", end="\r")
-        
+
+        detail_cache.save_cache(cache)
+
+        # Merge the delta into the cached corpus and persist the
+        # checkpoint. Fresh rows win URL collisions so a re-surfaced
+        # review (its PR was updated since the checkpoint) replaces the
+        # checkpointed copy instead of being pinned to it
+        fresh_urls = {row.get("review_url") for row in all_reviews}
+        all_reviews = [
+            row for row in cached_rows if row.get("review_url") not in fresh_urls
+        ] + all_reviews
+        checkpoint_store[checkpoint_key] = {"last_updated": last_updated, "rows": all_reviews}
+        search_cache.save_cache(checkpoint_store)
+
         print(f"\n  Processed {processed} PRs")
         print(f"  Found {len(all_reviews)} total reviews")
         
         if all_reviews and show_sample:
-            import json
+            from utils.json_utils import dumps_pretty
             print("\n=== Sample Code Review Object Shape ===")
-            print(json.dumps(all_reviews[0], indent=2, default=str))
+            print(dumps_pretty(all_reviews[0]))
             print("==================================\n")
         
         return all_reviews
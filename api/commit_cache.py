@@ -0,0 +1,57 @@
+"""Persistent on-disk cache for per-repository commit listings"""
+import json
+from pathlib import Path
+
+# One cache file per (owner, repo, username) so concurrent repo fetches
+# never contend on a shared file
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "commits"
+
+
+def _cache_path(owner, repo, username):
+    return CACHE_DIR / f"{owner}__{repo}__{username}.json"
+
+
+def load_entry(owner, repo, username, since_date):
+    """
+    Load the cached commit rows for a repository
+
+    Args:
+        owner: Repository owner
+        repo: Repository name
+        username: GitHub username the commits were filtered by
+        since_date: Date filter the rows were fetched with
+
+    Returns:
+        Entry dict with "etag" and "rows", or None if missing or
+        fetched with a different date filter
+    """
+    try:
+        with open(_cache_path(owner, repo, username), "r", encoding="utf-8") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if entry.get("since_date") != (since_date or ""):
+        return None
+
+    return entry
+
+
+def save_entry(owner, repo, username, since_date, rows, etag=None):
+    """
+    Persist the fetched commit rows with the listing's ETag
+
+    The ETag comes from GitHub's response, not the local clock, so the
+    validator can't be skewed; it is replayed as If-None-Match on the
+    next run so an unchanged repository answers with a body-less 304
+    """
+    entry = {
+        "since_date": since_date or "",
+        "etag": etag,
+        "rows": rows,
+    }
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(owner, repo, username).write_text(json.dumps(entry), encoding="utf-8")
+    except OSError as error:
+        print(f"  Warning: Could not save commit cache for {owner}/{repo}: {error}")
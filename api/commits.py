@@ -1,43 +1,61 @@
 """Commit fetching functions"""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from api import commit_cache
+from api.repositories import get_repo_cached
+from config.constants import MAX_CONCURRENT_FETCHES
+
 
 def transform_commit(commit, owner, repo):
-    """Transform raw commit data to our format"""
-    commit_data = commit.commit
-    
+    """
+    Transform raw commit data to our format
+
+    Reads the raw JSON payload directly instead of traversing PyGithub's
+    object graph, so no attribute access can trigger a lazy re-fetch
+    (dates arrive as ISO 8601 "Z" strings, no reformatting needed)
+    """
+    data = commit._rawData
+    commit_data = data.get("commit") or {}
+    author = commit_data.get("author") or {}
+    committer = commit_data.get("committer") or {}
+    verification = commit_data.get("verification") or {}
+    stats = data.get("stats") or {}
+    sha = data.get("sha", "")
+    message = commit_data.get("message", "")
+
     return {
         "type": "commit",
-        "sha": commit.sha,
-        "short_sha": commit.sha[:7],
-        "message": commit_data.message,
-        "message_first_line": commit_data.message.split("\n")[0],
-        "author_name": commit_data.author.name,
-        "author_email": commit_data.author.email,
-        "author_date": commit_data.author.date.isoformat().replace("+00:00", "Z") if commit_data.author.date else "",
-        "committer_name": commit_data.committer.name,
-        "committer_email": commit_data.committer.email,
-        "committer_date": commit_data.committer.date.isoformat().replace("+00:00", "Z") if commit_data.committer.date else "",
+        "sha": sha,
+        "short_sha": sha[:7],
+        "message": message,
+        "message_first_line": message.split("\n", 1)[0],
+        "author_name": author.get("name", ""),
+        "author_email": author.get("email", ""),
+        "author_date": author.get("date") or "",
+        "committer_name": committer.get("name", ""),
+        "committer_email": committer.get("email", ""),
+        "committer_date": committer.get("date") or "",
         "repo": f"{owner}/{repo}",
         "repo_owner": owner,
         "repo_name": repo,
-        "url": commit.html_url,
-        "api_url": commit.url,
-        "node_id": commit.node_id,
-        "parents": ";".join([p.sha for p in commit.parents]),
-        "stats_additions": getattr(commit.stats, "additions", "") if hasattr(commit, "stats") else "",
-        "stats_deletions": getattr(commit.stats, "deletions", "") if hasattr(commit, "stats") else "",
-        "stats_total": getattr(commit.stats, "total", "") if hasattr(commit, "stats") else "",
-        "files_changed": len(commit.files) if hasattr(commit, "files") else "",
-        "verification_verified": commit_data.verification.verified if commit_data.verification else False,
-        "verification_reason": commit_data.verification.reason if commit_data.verification else "",
+        "url": data.get("html_url", ""),
+        "api_url": data.get("url", ""),
+        "node_id": data.get("node_id", ""),
+        "parents": ";".join(p["sha"] for p in data.get("parents", [])),
+        "stats_additions": stats.get("additions", ""),
+        "stats_deletions": stats.get("deletions", ""),
+        "stats_total": stats.get("total", ""),
+        "files_changed": len(data["files"]) if "files" in data else "",
+        "verification_verified": verification.get("verified", False),
+        "verification_reason": verification.get("reason", ""),
     }
 
 
-def fetch_commits(github_client, owner, repo, username, since_date=None, show_sample=False):
+def fetch_commits(github_client, owner, repo, username, since_date=None, show_sample=False, include_stats=False):
     """
     Fetch commits from a repository
-    
+
     Args:
         github_client: Authenticated GitHub client
         owner: Repository owner
@@ -45,31 +63,105 @@ def fetch_commits(github_client, owner, repo, username, since_date=None, show_sa
         username: GitHub username to filter commits
         since_date: Optional ISO date string to filter commits
         show_sample: Whether to print a sample commit object
-    
+        include_stats: Whether to fetch per-commit stats/files (costs one
+            extra API call per commit, so disabled by default)
+
     Returns:
         List of transformed commit dictionaries
     """
     try:
-        repository = github_client.get_repo(f"{owner}/{repo}")
-        
-        # Build parameters
-        params = {"author": username}
-        if since_date:
-            params["since"] = datetime.fromisoformat(since_date.replace("Z", "+00:00"))
-        
-        commits = []
-        for commit in repository.get_commits(**params):
-            commits.append(transform_commit(commit, owner, repo))
-        
+        # Re-use last run's rows when the listing is unchanged: the
+        # conditional probe costs no body transfer and no rate limit.
+        # The probe runs before the fetch so the stored ETag can only
+        # predate the rows — a push racing the fetch makes the next
+        # probe miss and refetch, never serve stale rows
+        cached = commit_cache.load_entry(owner, repo, username, since_date)
+        not_modified, etag = _probe_listing(
+            github_client, owner, repo, username, cached.get("etag") if cached else None
+        )
+        if cached and not_modified:
+            return cached["rows"]
+
+        commits = list(_iter_commits(github_client, owner, repo, username, since_date, include_stats))
+        commit_cache.save_entry(owner, repo, username, since_date, commits, etag)
+
         # Log first commit to see the shape (only once)
         if commits and show_sample:
-            import json
+            from utils.json_utils import dumps_pretty
             print("\n=== Sample Commit Object Shape ===")
-            print(json.dumps(commits[0], indent=2, default=str))
+            print(dumps_pretty(commits[0]))
             print("===================================\n")
-        
+
         return commits
     except Exception as error:
         print(f"Error fetching commits for {owner}/{repo}: {error}")
         return []
 
+
+def _probe_listing(github_client, owner, repo, username, etag=None):
+    """
+    Probe the commits listing, conditionally when an ETag is cached
+
+    The ETag is GitHub's own validator, so the check is immune to local
+    clock skew (an If-Modified-Since built from our wall clock could
+    answer 304 for commits pushed inside the skew window)
+
+    Args:
+        github_client: Authenticated GitHub client
+        owner: Repository owner
+        repo: Repository name
+        username: GitHub username the listing is filtered by
+        etag: ETag from the previous run, or None to probe unconditionally
+
+    Returns:
+        (not_modified, etag) tuple; not_modified is True when GitHub
+        answered 304 (empty body, no rate-limit cost), and etag is the
+        current validator to store for the next run
+    """
+    headers = {"If-None-Match": etag} if etag else {}
+    try:
+        response_headers, data = github_client.requester.requestJsonAndCheck(
+            "GET",
+            f"/repos/{owner}/{repo}/commits",
+            parameters={"author": username, "per_page": 1},
+            headers=headers,
+        )
+    except Exception:
+        # Treat any probe failure (e.g. empty repository) as modified
+        # and fall through to the normal fetch path
+        return False, None
+    if data is None:
+        return True, etag
+    return False, (response_headers or {}).get("etag")
+
+
+def _iter_commits(github_client, owner, repo, username, since_date=None, include_stats=False):
+    """
+    Yield transformed commit dictionaries one at a time
+
+    Rows stream straight from the paginated listing into the consumer
+    (e.g. the CSV writer) without materializing an intermediate list
+    """
+    repository = get_repo_cached(github_client, f"{owner}/{repo}")
+
+    # Build parameters
+    params = {"author": username}
+    if since_date:
+        params["since"] = datetime.fromisoformat(since_date.replace("Z", "+00:00"))
+
+    listed = repository.get_commits(**params)
+
+    if include_stats:
+        # The list endpoint omits stats/files; fetch the commit details
+        # concurrently for the callers that explicitly opt in
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            for commit in executor.map(
+                lambda commit: repository.get_commit(commit.sha),
+                list(listed),
+            ):
+                yield transform_commit(commit, owner, repo)
+        return
+
+    for commit in listed:
+        yield transform_commit(commit, owner, repo)
+
@@ -0,0 +1,93 @@
+"""Persistent on-disk cache for PR details and reviews"""
+import json
+import time
+from pathlib import Path
+
+# Cache file lives next to exports/ so repeat runs on the same checkout
+# can skip re-downloading PR bodies that have not changed
+CACHE_PATH = Path(__file__).parent.parent / ".cache" / "pr_details.json"
+
+# Merged/closed PRs are effectively immutable, so cache them for a week
+# Open PRs can still change, so only cache them for an hour
+CLOSED_PR_TTL_SECONDS = 7 * 24 * 60 * 60
+OPEN_PR_TTL_SECONDS = 60 * 60
+
+
+def cache_key(owner, repo, pr_number):
+    """Build the cache key for a pull request"""
+    return f"{owner}/{repo}#{pr_number}"
+
+
+def load_cache():
+    """
+    Load the PR detail cache from disk
+
+    Returns:
+        Dictionary mapping cache keys to cached entries (empty if no cache)
+    """
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    """Persist the PR detail cache to disk"""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as error:
+        print(f"  Warning: Could not save PR detail cache: {error}")
+
+
+def get_cached(cache, owner, repo, pr_number, updated_at=None):
+    """
+    Return the cached entry for a PR if present and still fresh
+
+    Args:
+        cache: Cache dictionary from load_cache
+        owner: Repository owner
+        repo: Repository name
+        pr_number: Pull request number
+        updated_at: Optional datetime of the PR's last known change;
+            entries cached before it are treated as misses regardless
+            of TTL, so a PR that changed (new review, reopen) is
+            re-fetched even inside the closed-PR window
+
+    Returns:
+        Cached entry dict or None if missing/stale
+    """
+    entry = cache.get(cache_key(owner, repo, pr_number))
+    if not entry:
+        return None
+
+    cached_at = entry.get("cached_at", 0)
+    if updated_at is not None and cached_at < updated_at.timestamp():
+        return None
+
+    ttl = OPEN_PR_TTL_SECONDS if entry.get("state") == "open" else CLOSED_PR_TTL_SECONDS
+    if time.time() - cached_at > ttl:
+        return None
+
+    return entry
+
+
+def put_cached(cache, owner, repo, pr_number, pr_data, reviews_data=None):
+    """
+    Store raw PR data (and optionally its reviews) in the cache
+
+    Args:
+        cache: Cache dictionary from load_cache
+        owner: Repository owner
+        repo: Repository name
+        pr_number: Pull request number
+        pr_data: Raw PR JSON dictionary
+        reviews_data: Optional list of raw review JSON dictionaries
+    """
+    cache[cache_key(owner, repo, pr_number)] = {
+        "cached_at": time.time(),
+        "state": pr_data.get("state", ""),
+        "pull_request": pr_data,
+        "reviews": reviews_data,
+    }
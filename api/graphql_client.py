@@ -0,0 +1,181 @@
+"""Batched GraphQL fetching for pull request details and reviews"""
+
+# Number of pull requests resolved per GraphQL request via aliases
+# Large enough to collapse hundreds of REST calls, small enough to stay
+# under GitHub's GraphQL node and complexity limits
+GRAPHQL_BATCH_SIZE = 40
+
+_PR_FIELDS_FRAGMENT = """
+fragment PrFields on PullRequest {
+  number
+  title
+  state
+  isDraft
+  merged
+  createdAt
+  mergedAt
+  closedAt
+  url
+  id
+  headRefOid
+  mergeCommit { oid }
+  author { login }
+}
+"""
+
+# Reviews are capped at the first 100 per PR, which covers all but
+# pathological review threads
+_PR_REVIEWS_FRAGMENT = """
+fragment PrReviews on PullRequest {
+  reviews(first: 100) {
+    nodes {
+      databaseId
+      state
+      body
+      submittedAt
+      url
+      commit { oid }
+      author { login }
+    }
+  }
+}
+"""
+
+
+def post_graphql(github_client, query, variables=None):
+    """
+    Execute a GraphQL query through the authenticated client
+
+    Partial errors (e.g. a single missing repository alias) are logged
+    and the successfully resolved data is still returned
+
+    Args:
+        github_client: Authenticated GitHub client
+        query: GraphQL query string
+        variables: Optional dictionary of query variables
+
+    Returns:
+        The "data" portion of the GraphQL response (empty dict on failure)
+    """
+    requester = github_client.requester
+    _, response = requester.requestJsonAndCheck(
+        "POST",
+        requester.graphql_url,
+        input={"query": query, "variables": variables or {}},
+    )
+
+    for error in response.get("errors") or []:
+        print(f"  Warning: GraphQL error: {error.get('message')}")
+
+    return response.get("data") or {}
+
+
+def _pr_node_to_raw(node, owner, repo, api_base_url):
+    """Adapt a GraphQL PullRequest node to the REST raw-data shape"""
+    author = node.get("author") or {}
+    merge_commit = node.get("mergeCommit") or {}
+    number = node["number"]
+
+    return {
+        "number": number,
+        "title": node.get("title") or "",
+        "state": "open" if node.get("state") == "OPEN" else "closed",
+        "created_at": node.get("createdAt"),
+        "merged_at": node.get("mergedAt"),
+        "closed_at": node.get("closedAt"),
+        "merged": bool(node.get("merged")),
+        "draft": bool(node.get("isDraft")),
+        "html_url": node.get("url"),
+        "url": f"{api_base_url}/repos/{owner}/{repo}/pulls/{number}",
+        "node_id": node.get("id"),
+        "merge_commit_sha": merge_commit.get("oid") or "",
+        "head": {"sha": node.get("headRefOid") or ""},
+        "base": {"repo": {"name": repo, "owner": {"login": owner}}},
+        "user": {"login": author.get("login") or ""},
+    }
+
+
+def _review_node_to_raw(node, pr_raw):
+    """Adapt a GraphQL PullRequestReview node to the REST raw-data shape"""
+    author = node.get("author") or {}
+    commit = node.get("commit") or {}
+
+    return {
+        "id": node.get("databaseId"),
+        "state": node.get("state"),
+        "body": node.get("body") or "",
+        "submitted_at": node.get("submittedAt"),
+        "html_url": node.get("url"),
+        "user": {"login": author.get("login") or ""},
+        "commit_id": commit.get("oid") or "",
+        "pull_request_url": pr_raw["url"],
+    }
+
+
+def fetch_pull_requests_batch(github_client, pr_refs, include_reviews=False):
+    """
+    Fetch details for many pull requests in batched GraphQL queries
+
+    Collapses the per-PR REST round-trips into one aliased query per
+    GRAPHQL_BATCH_SIZE PRs (and folds the reviews listing into the same
+    query when requested)
+
+    Args:
+        github_client: Authenticated GitHub client
+        pr_refs: List of (owner, repo, pr_number) tuples
+        include_reviews: Whether to also fetch each PR's reviews
+
+    Returns:
+        List of (pr_raw, reviews_raw) tuples aligned with pr_refs, where
+        raw values are REST-shaped dictionaries; (None, None) for PRs
+        that could not be resolved
+    """
+    api_base_url = github_client.requester.base_url
+
+    fragments = _PR_FIELDS_FRAGMENT
+    spreads = "...PrFields"
+    if include_reviews:
+        fragments += _PR_REVIEWS_FRAGMENT
+        spreads += " ...PrReviews"
+
+    results = []
+    for start in range(0, len(pr_refs), GRAPHQL_BATCH_SIZE):
+        chunk = pr_refs[start:start + GRAPHQL_BATCH_SIZE]
+
+        declarations = []
+        selections = []
+        variables = {}
+        for i, (owner, repo, number) in enumerate(chunk):
+            declarations.extend([f"$o{i}: String!", f"$r{i}: String!", f"$n{i}: Int!"])
+            selections.append(
+                f"pr{i}: repository(owner: $o{i}, name: $r{i}) "
+                f"{{ pullRequest(number: $n{i}) {{ {spreads} }} }}"
+            )
+            variables[f"o{i}"] = owner
+            variables[f"r{i}"] = repo
+            variables[f"n{i}"] = int(number)
+
+        query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}\n{fragments}"
+
+        try:
+            data = post_graphql(github_client, query, variables)
+        except Exception as error:
+            print(f"  Warning: GraphQL batch fetch failed: {error}")
+            data = {}
+
+        for i, (owner, repo, number) in enumerate(chunk):
+            repo_node = data.get(f"pr{i}") or {}
+            node = repo_node.get("pullRequest")
+            if not node:
+                results.append((None, None))
+                continue
+
+            pr_raw = _pr_node_to_raw(node, owner, repo, api_base_url)
+            reviews_raw = None
+            if include_reviews:
+                review_nodes = (node.get("reviews") or {}).get("nodes") or []
+                reviews_raw = [_review_node_to_raw(n, pr_raw) for n in review_nodes]
+
+            results.append((pr_raw, reviews_raw))
+
+    return results
@@ -1,50 +1,82 @@
 """Pull request fetching functions"""
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from github.PullRequest import PullRequest
+
+from api import detail_cache
+from api import search_cache
+from api.graphql_client import fetch_pull_requests_batch
+from api.repositories import get_repo_cached
+from api.search import iter_search_issues
+from config.constants import MAX_CONCURRENT_FETCHES
+from utils.date_utils import format_iso_utc
+from utils.text_utils import to_single_line
+
+# Extracts (owner, repo, number) from a PR html_url, compiled once
+# instead of per search hit
+PR_URL_PATTERN = re.compile(r".*/([^/]+)/([^/]+)/pull/(\d+)")
+
 
 def transform_pull_request(pr):
-    """Transform raw pull request data to our format"""
+    """
+    Transform raw pull request data to our format
+
+    Reads the raw JSON payload directly instead of traversing PyGithub's
+    object graph, so no attribute access can trigger a lazy re-fetch
+    (dates arrive as ISO 8601 "Z" strings, no reformatting needed)
+    """
+    data = pr._rawData
+
     # Extract owner/repo from the repository
-    owner = pr.base.repo.owner.login
-    repo = pr.base.repo.name
-    
+    base_repo = (data.get("base") or {}).get("repo") or {}
+    owner = (base_repo.get("owner") or {}).get("login", "")
+    repo = base_repo.get("name", "")
+    user = data.get("user") or {}
+    head = data.get("head") or {}
+
+    # The list-pulls endpoint omits "merged"; fall back to merged_at
+    merged = data.get("merged", data.get("merged_at") is not None)
+    merge_commit_sha = data.get("merge_commit_sha") or ""
+
     # Use merge commit SHA if merged, otherwise use head SHA
-    sha = pr.merge_commit_sha if pr.merged else (pr.head.sha if pr.head else "")
-    short_sha = sha[:7] if sha else f"pr-{pr.number}"
-    
+    sha = merge_commit_sha if merged else (head.get("sha") or "")
+    number = data.get("number")
+    short_sha = sha[:7] if sha else f"pr-{number}"
+
     # Sanitize title to single line (remove newlines)
-    title = (pr.title or "").replace("\n", " ").replace("\r", " ").strip()
-    
+    title = to_single_line(data.get("title"))
+
     return {
         "type": "pull-request",
-        "number": pr.number,
+        "number": number,
         "sha": sha,
         "short_sha": short_sha,
         "title": title,
-        "state": pr.state,
-        "created_at": pr.created_at.isoformat().replace("+00:00", "Z") if pr.created_at else "",
-        "merged_at": pr.merged_at.isoformat().replace("+00:00", "Z") if pr.merged_at else "",
-        "closed_at": pr.closed_at.isoformat().replace("+00:00", "Z") if pr.closed_at else "",
-        "author_name": pr.user.login if pr.user else "",
-        "author_date": pr.created_at.isoformat().replace("+00:00", "Z") if pr.created_at else "",
+        "state": data.get("state", ""),
+        "created_at": data.get("created_at") or "",
+        "merged_at": data.get("merged_at") or "",
+        "closed_at": data.get("closed_at") or "",
+        "author_name": user.get("login", ""),
+        "author_date": data.get("created_at") or "",
         "repo": f"{owner}/{repo}",
         "repo_owner": owner,
         "repo_name": repo,
-        "url": pr.html_url,
-        "api_url": pr.url,
-        "node_id": pr.node_id,
-        "merged": pr.merged,
-        "draft": pr.draft,
-        "head_sha": pr.head.sha if pr.head else "",
-        "merge_commit_sha": pr.merge_commit_sha if pr.merged else "",
+        "url": data.get("html_url", ""),
+        "api_url": data.get("url", ""),
+        "node_id": data.get("node_id", ""),
+        "merged": merged,
+        "draft": data.get("draft", False),
+        "head_sha": head.get("sha") or "",
+        "merge_commit_sha": merge_commit_sha if merged else "",
     }
 
 
 def fetch_pull_request_details(github_client, owner, repo, pr_number):
     """Fetch full PR details to get merge_commit_sha and other fields"""
     try:
-        repository = github_client.get_repo(f"{owner}/{repo}")
+        repository = get_repo_cached(github_client, f"{owner}/{repo}")
         pr = repository.get_pull(pr_number)
         return pr
     except Exception as error:
@@ -52,6 +84,71 @@ def fetch_pull_request_details(github_client, owner, repo, pr_number):
         return None
 
 
+def fetch_pull_request_details_cached(github_client, owner, repo, pr_number, cache):
+    """
+    Fetch full PR details, serving from the on-disk cache when fresh
+
+    Cache hits avoid the HTTP request entirely and don't count against
+    the API rate limit
+    """
+    entry = detail_cache.get_cached(cache, owner, repo, pr_number)
+    if entry is not None:
+        return github_client.create_from_raw_data(PullRequest, entry["pull_request"])
+
+    pr = fetch_pull_request_details(github_client, owner, repo, pr_number)
+    if pr is not None:
+        detail_cache.put_cached(cache, owner, repo, pr_number, pr.raw_data)
+    return pr
+
+
+def _resolve_pr_details(github_client, pr_refs, cache):
+    """
+    Resolve full PR details for all refs with as few requests as possible
+
+    Resolution order: on-disk cache, then batched GraphQL queries (one
+    request per 40 PRs instead of one REST call each), then a bounded
+    concurrent REST fallback for anything GraphQL could not resolve
+
+    Returns:
+        List of PullRequest objects (or None) aligned with pr_refs
+    """
+    resolved = [None] * len(pr_refs)
+
+    to_fetch = []
+    for i, (owner, repo, pr_number, _issue) in enumerate(pr_refs):
+        entry = detail_cache.get_cached(cache, owner, repo, pr_number)
+        if entry is not None:
+            resolved[i] = github_client.create_from_raw_data(PullRequest, entry["pull_request"])
+        else:
+            to_fetch.append(i)
+
+    if to_fetch:
+        batch = fetch_pull_requests_batch(
+            github_client,
+            [pr_refs[i][:3] for i in to_fetch],
+        )
+        for i, (pr_raw, _reviews_raw) in zip(to_fetch, batch):
+            if pr_raw is not None:
+                owner, repo, pr_number, _issue = pr_refs[i]
+                detail_cache.put_cached(cache, owner, repo, pr_number, pr_raw)
+                resolved[i] = github_client.create_from_raw_data(PullRequest, pr_raw)
+
+    # REST fallback for anything the batched queries could not resolve
+    missing = [i for i in to_fetch if resolved[i] is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            fetched = executor.map(
+                lambda i: fetch_pull_request_details_cached(
+                    github_client, pr_refs[i][0], pr_refs[i][1], pr_refs[i][2], cache
+                ),
+                missing,
+            )
+            for i, pr in zip(missing, fetched):
+                resolved[i] = pr
+
+    return resolved
+
+
 def search_user_pull_requests(github_client, username, since_date=None, show_sample=False):
     """
     Search for all pull requests authored by a user using the Search API
@@ -69,71 +166,123 @@ def search_user_pull_requests(github_client, username, since_date=None, show_sam
     try:
         # Build search query
         query = f"author:{username} type:pr"
-        
+
         # Add date filter if provided
         if since_date:
             date_str = since_date.split("T")[0]  # Get just the date part
             query += f" created:>={date_str}"
-        
+
+        # Resume from the last run's checkpoint so incremental runs only
+        # scan PRs created since then instead of the full history
+        checkpoint_store = search_cache.load_cache()
+        checkpoint_key = search_cache.entry_key("pull-requests", username, since_date)
+        checkpoint = checkpoint_store.get(checkpoint_key) or {}
+        cached_rows = checkpoint.get("rows") or []
+        last_created = checkpoint.get("last_created") or ""
+        if last_created:
+            query += f" created:>={last_created}"
+
         print(f"\n🔍 Searching PRs with query: \"{query}\"")
-        
-        # Search API returns max 1000 results
-        search_results = github_client.search_issues(query, sort="created", order="desc")
-        
-        prs = []
-        count = 0
+
+        # Ascending order streams oldest-first, so the last processed
+        # item is always a valid resume checkpoint; iter_search_issues
+        # re-windows the query past the Search API's 1000-result cap
+        search_results = iter_search_issues(github_client, query)
+
+        # Collect (owner, repo, number) references first so the detail
+        # fetches can run concurrently instead of one RTT per iteration
+        pr_refs = []
         for issue in search_results:
             if issue.pull_request:  # Ensure it's a PR
                 # Extract owner/repo from URL
-                match = re.match(r".*/([^/]+)/([^/]+)/pull/(\d+)", issue.html_url)
+                match = PR_URL_PATTERN.match(issue.html_url)
                 if not match:
                     print(f"  Warning: Could not parse PR URL: {issue.html_url}")
                     continue
-                
+
                 owner, repo, pr_number = match.groups()
-                
-                # Fetch full PR details
-                full_pr = fetch_pull_request_details(github_client, owner, repo, int(pr_number))
-                
-                if full_pr:
-                    prs.append(transform_pull_request(full_pr))
-                else:
-                    # Fall back to issue if details fetch fails
-                    # Note: This won't have all PR-specific fields
-                    prs.append({
-                        "type": "pull-request",
-                        "number": issue.number,
-                        "sha": "",
-                        "short_sha": f"pr-{issue.number}",
-                        "title": issue.title.replace("\n", " ").replace("\r", " ").strip(),
-                        "state": issue.state,
-                        "created_at": issue.created_at.isoformat() + "Z" if issue.created_at else "",
-                        "merged_at": "",
-                        "closed_at": issue.closed_at.isoformat() + "Z" if issue.closed_at else "",
-                        "author_name": issue.user.login if issue.user else "",
-                        "author_date": issue.created_at.isoformat() + "Z" if issue.created_at else "",
-                        "repo": f"{owner}/{repo}",
-                        "repo_owner": owner,
-                        "repo_name": repo,
-                        "url": issue.html_url,
-                        "api_url": issue.url,
-                        "node_id": issue.node_id,
-                        "merged": False,
-                        "draft": False,
-                        "head_sha": "",
-                        "merge_commit_sha": "",
-                    })
-                
-                count += 1
-                if count % 10 == 0:
-                    print(f"  Processed {count} PRs...", end="\r")
-        
+                pr_refs.append((owner, repo, int(pr_number), issue))
+                if issue.created_at:
+                    last_created = format_iso_utc(issue.created_at)
+
+        prs = []
+        count = 0
+        cache = detail_cache.load_cache()
+        # Resolve full PR details via cache + batched GraphQL (REST fallback)
+        details = _resolve_pr_details(github_client, pr_refs, cache)
+        for (owner, repo, pr_number, issue), full_pr in zip(pr_refs, details):
+            if full_pr:
+                prs.append(transform_pull_request(full_pr))
+            else:
+                # Fall back to issue if details fetch fails
+                # Note: This won't have all PR-specific fields
+                prs.append({
+                    "type": "pull-request",
+                    "number": issue.number,
+                    "sha": "",
+                    "short_sha": f"pr-{issue.number}",
+                    "title": to_single_line(issue.title),
+                    "state": issue.state,
+                    "created_at": format_iso_utc(issue.created_at),
+                    "merged_at": "",
+                    "closed_at": format_iso_utc(issue.closed_at),
+                    "author_name": issue.user.login if issue.user else "",
+                    "author_date": format_iso_utc(issue.created_at),
+                    "repo": f"{owner}/{repo}",
+                    "repo_owner": owner,
+                    "repo_name": repo,
+                    "url": issue.html_url,
+                    "api_url": issue.url,
+                    "node_id": issue.node_id,
+                    "merged": False,
+                    "draft": False,
+                    "head_sha": "",
+                    "merge_commit_sha": "",
+                })
+
+            count += 1
+            if count % 10 == 0:
+                print(f"  Processed {count} PRs...", end="\r")
+
+        # Merge the delta into the cached corpus. Fresh rows win URL
+        # collisions so the checkpoint can never pin a stale copy, and
+        # checkpointed rows that were still open are re-resolved through
+        # the detail cache (whose short open-PR TTL forces a re-fetch)
+        # so merges and closes eventually reach the corpus
+        fresh_urls = {row.get("url") for row in prs}
+        carried = []
+        refresh_refs = []
+        refresh_rows = []
+        for row in cached_rows:
+            if row.get("url") in fresh_urls:
+                continue
+            match = PR_URL_PATTERN.match(row.get("url") or "")
+            if row.get("state") == "closed" or not match:
+                carried.append(row)
+                continue
+            owner, repo, pr_number = match.groups()
+            refresh_refs.append((owner, repo, int(pr_number), None))
+            refresh_rows.append(row)
+
+        if refresh_refs:
+            refreshed = _resolve_pr_details(github_client, refresh_refs, cache)
+            for row, full_pr in zip(refresh_rows, refreshed):
+                # Keep the old row if the refresh could not resolve
+                carried.append(transform_pull_request(full_pr) if full_pr else row)
+
+        prs = carried + prs
+
+        detail_cache.save_cache(cache)
+
+        checkpoint_store[checkpoint_key] = {"last_created": last_created, "rows": prs}
+        search_cache.save_cache(checkpoint_store)
+
         print(f"\n📊 Found {len(prs)} total PRs")
         
         if prs and show_sample:
-            import json
+            from utils.json_utils import dumps_pretty
             print("\n=== Sample Pull Request Object Shape ===")
-            print(json.dumps(prs[0], indent=2, default=str))
+            print(dumps_pretty(prs[0]))
             print("========================================\n")
         
         return prs
@@ -148,7 +297,7 @@ def fetch_pull_requests(github_client, owner, repo, username, since_date=None, s
     Kept for backwards compatibility
     """
     try:
-        repository = github_client.get_repo(f"{owner}/{repo}")
+        repository = get_repo_cached(github_client, f"{owner}/{repo}")
         
         prs = []
         for pr in repository.get_pulls(state="all", sort="created", direction="desc"):
@@ -164,9 +313,9 @@ def fetch_pull_requests(github_client, owner, repo, username, since_date=None, s
         
         # Log first PR to see the shape (only once)
         if prs and show_sample:
-            import json
+            from utils.json_utils import dumps_pretty
             print("\n=== Sample Pull Request Object Shape ===")
-            print(json.dumps(prs[0], indent=2, default=str))
+            print(dumps_pretty(prs[0]))
             print("========================================\n")
         
         return prs
@@ -1,5 +1,28 @@
 """Repository fetching functions"""
 
+# Memoizes Repository objects per client so the fetch loops don't
+# re-issue GET /repos/{owner}/{repo} for every PR/commit in one repo
+_repo_cache = {}
+
+
+def get_repo_cached(github_client, full_name):
+    """
+    Return the repository for full_name, memoized per client
+
+    Args:
+        github_client: Authenticated GitHub client
+        full_name: "owner/repo" string
+
+    Returns:
+        Repository object (fetched at most once per client)
+    """
+    key = (id(github_client), full_name)
+    repo = _repo_cache.get(key)
+    if repo is None:
+        repo = github_client.get_repo(full_name)
+        _repo_cache[key] = repo
+    return repo
+
 
 def fetch_user_repos(github_client, affiliation):
     """
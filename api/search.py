@@ -0,0 +1,54 @@
+"""Search API helpers"""
+from utils.date_utils import format_iso_utc
+
+# The Search API silently truncates any single query at 1000 results
+SEARCH_RESULT_CAP = 1000
+
+
+def iter_search_issues(github_client, query, sort="created"):
+    """
+    Iterate search results in ascending order of the sort field, working
+    around the Search API's 1000-result cap
+
+    When a query hits the cap, it is re-issued with a window qualifier
+    (created:>= or updated:>=, matching the sort field) starting at the
+    last result seen; because results stream oldest-first, each window
+    picks up exactly where the previous one stopped. Duplicates on the
+    inclusive window boundary are dropped by issue id.
+
+    Args:
+        github_client: Authenticated GitHub client
+        query: Search query string
+        sort: Field to sort and window on, "created" or "updated"
+
+    Yields:
+        Issue objects in ascending sort order, beyond the 1000 cap
+    """
+    seen_ids = set()
+    window_query = query
+    previous_window = None
+
+    while True:
+        results = github_client.search_issues(window_query, sort=sort, order="asc")
+
+        count = 0
+        last_value = None
+        for issue in results:
+            count += 1
+            if issue.id not in seen_ids:
+                seen_ids.add(issue.id)
+                yield issue
+            last_value = issue.created_at if sort == "created" else issue.updated_at
+            if count >= SEARCH_RESULT_CAP:
+                break
+
+        if count < SEARCH_RESULT_CAP or last_value is None:
+            return
+
+        window_query = f"{query} {sort}:>={format_iso_utc(last_value)}"
+        if window_query == previous_window:
+            # More than 1000 results share one timestamp; nothing more
+            # can be windowed out of the API
+            print("  Warning: Search window could not advance past the result cap")
+            return
+        previous_window = window_query
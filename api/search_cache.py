@@ -0,0 +1,37 @@
+"""Persistent checkpoint cache for Search API queries"""
+import json
+from pathlib import Path
+
+# Stores, per search query, the transformed rows fetched so far and the
+# window-field timestamp of the newest result (created_at for PRs,
+# updated_at for reviews), so incremental runs only scan the delta
+CACHE_PATH = Path(__file__).parent.parent / ".cache" / "search_results.json"
+
+
+def entry_key(kind, username, since_date):
+    """Build the cache key for a search query"""
+    return f"{kind}:{username}|{since_date or ''}"
+
+
+def load_cache():
+    """
+    Load the search checkpoint cache from disk
+
+    Returns:
+        Dictionary mapping entry keys to checkpoint entries holding the
+        fetched rows and the window timestamp to resume from
+    """
+    try:
+        with open(CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache):
+    """Persist the search checkpoint cache to disk"""
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+    except OSError as error:
+        print(f"  Warning: Could not save search checkpoint cache: {error}")
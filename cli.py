@@ -1,19 +1,21 @@
 """Main CLI entry point"""
 import sys
 import time
-import questionary
 from api.github_client import create_github_client, get_github_username
 from utils.validation_utils import validate_environment
 from cli_components.banner import display_banner
-from cli_components.prompts import prompt_user
 from cli_components.args import parse_args
-from cli_components.import_prompts import prompt_import_options
 from cli_components.import_args import parse_import_args
+
 from services.fetch_service import process_repositories
 from services.export_service import export_to_csv
 from services.import_service import import_contributions
 from services.git_commit_service import commit_contributions
 
+# questionary (and the prompt modules built on it) pulls in prompt_toolkit,
+# a noticeable chunk of cold-start time, so it is imported lazily inside
+# the interactive code paths and argument-driven runs never pay for it
+
 
 def display_fetch_config(username, since_date, affiliation, fetch_commits, fetch_pull_requests, fetch_code_reviews):
     """Display configuration summary for fetch"""
@@ -137,6 +139,7 @@ def handle_fetch():
     if not args["hasArgs"]:
         # Interactive mode: prompt user
         try:
+            from cli_components.prompts import prompt_user
             user_input = prompt_user()
             since_date = user_input["sinceDate"]
             affiliation = user_input["affiliation"]
@@ -209,6 +212,7 @@ def handle_import():
     if not args["hasArgs"]:
         # Interactive mode: prompt user
         try:
+            from cli_components.import_prompts import prompt_import_options
             user_input = prompt_import_options()
             import_commits = user_input["importCommits"]
             import_pull_requests = user_input["importPullRequests"]
@@ -235,6 +239,8 @@ def handle_import():
 
 def handle_commit():
     """Handle git commit operation"""
+    import questionary
+
     try:
         commit_types = questionary.checkbox(
             "Which contributions would you like to commit?",
@@ -265,6 +271,8 @@ def handle_commit():
 
 def prompt_operation():
     """Prompt user for operation selection"""
+    import questionary
+
     operation = questionary.select(
         "What would you like to do?",
         choices=[
@@ -1,11 +1,12 @@
 """Command line argument parsing for import"""
 import sys
-from pathlib import Path
+from config.paths import EXPORTS_DIR
+from utils.exports_probe import probe_exports
 
-
-def file_exists(file_path):
-    """Check if a file exists"""
-    return Path(file_path).exists()
+# Recognized type tokens, precompiled for O(1) membership tests
+_COMMIT_TOKENS = frozenset({"commits", "commit"})
+_PR_TOKENS = frozenset({"prs", "pr", "pullrequests"})
+_REVIEW_TOKENS = frozenset({"reviews", "review", "codereviews"})
 
 
 def parse_import_args():
@@ -15,16 +16,8 @@ def parse_import_args():
     Returns:
         Dictionary with parsed import arguments
     """
-    # Get the script directory (parent of cli/)
-    script_dir = Path(__file__).parent.parent
-    exports_dir = script_dir / "exports"
-    commits_csv_path = exports_dir / "commits.csv"
-    prs_csv_path = exports_dir / "pullRequests.csv"
-    reviews_csv_path = exports_dir / "codeReviews.csv"
-    
-    has_commits = file_exists(commits_csv_path)
-    has_prs = file_exists(prs_csv_path)
-    has_reviews = file_exists(reviews_csv_path)
+    # One directory read covers all three CSV existence checks
+    has_commits, has_prs, has_reviews = probe_exports(EXPORTS_DIR)
     
     types_arg = sys.argv[2] if len(sys.argv) > 2 else None
     
@@ -40,16 +33,22 @@ def parse_import_args():
     
     # If argument provided, use it to filter
     if types_arg:
-        normalized = types_arg.lower()
-        types = [t.strip() for t in normalized.split(",")]
+        normalized = types_arg.strip().lower()
+        
+        # Fast path: the dominant single-token case ("commits", "all",
+        # ...) skips the split and per-token strip entirely
+        if "," not in normalized:
+            types = {normalized}
+        else:
+            types = {t.strip() for t in normalized.split(",")}
         
         # Reset all flags
         import_commits = False
         import_pull_requests = False
         import_code_reviews = False
         
-        # Handle special cases
-        if normalized == "all":
+        # Handle special cases ("all" wins even inside a comma list)
+        if "all" in types:
             import_commits = has_commits
             import_pull_requests = has_prs
             import_code_reviews = has_reviews
@@ -57,18 +56,18 @@ def parse_import_args():
             import_commits = has_commits
             import_pull_requests = has_prs
         else:
-            # Set flags based on individual types
-            if "commits" in types or "commit" in types:
+            # Set flags from one set intersection per type
+            if types & _COMMIT_TOKENS:
                 if not has_commits:
                     print("❌ Error: commits.csv not found")
                     sys.exit(1)
                 import_commits = True
-            if "prs" in types or "pr" in types or "pullrequests" in types:
+            if types & _PR_TOKENS:
                 if not has_prs:
                     print("❌ Error: pullRequests.csv not found")
                     sys.exit(1)
                 import_pull_requests = True
-            if "reviews" in types or "review" in types or "codereviews" in types:
+            if types & _REVIEW_TOKENS:
                 if not has_reviews:
                     print("❌ Error: codeReviews.csv not found")
                     sys.exit(1)
@@ -1,11 +1,7 @@
 """Interactive prompts for import options"""
 import questionary
-from pathlib import Path
-
-
-def file_exists(file_path):
-    """Check if a file exists"""
-    return Path(file_path).exists()
+from config.paths import EXPORTS_DIR
+from utils.exports_probe import probe_exports
 
 
 def prompt_import_options():
@@ -15,16 +11,8 @@ def prompt_import_options():
     Returns:
         Dictionary with import selections
     """
-    # Get the script directory (parent of cli/)
-    script_dir = Path(__file__).parent.parent
-    exports_dir = script_dir / "exports"
-    commits_csv_path = exports_dir / "commits.csv"
-    prs_csv_path = exports_dir / "pullRequests.csv"
-    reviews_csv_path = exports_dir / "codeReviews.csv"
-    
-    has_commits = file_exists(commits_csv_path)
-    has_prs = file_exists(prs_csv_path)
-    has_reviews = file_exists(reviews_csv_path)
+    # One directory read covers all three CSV existence checks
+    has_commits, has_prs, has_reviews = probe_exports(EXPORTS_DIR)
     
     if not has_commits and not has_prs and not has_reviews:
         raise FileNotFoundError("No CSV files found in exports/ directory")
@@ -4,6 +4,11 @@ from utils.date_utils import validate_date
 from utils.validation_utils import validate_affiliation
 from config.constants import DEFAULT_AFFILIATION
 
+# Recognized type tokens, precompiled for O(1) membership tests
+_COMMIT_TOKENS = frozenset({"commits", "commit"})
+_PR_TOKENS = frozenset({"prs", "pr", "pullrequests"})
+_REVIEW_TOKENS = frozenset({"reviews", "review", "codereviews"})
+
 
 def parse_args():
     """
@@ -44,16 +49,17 @@ def parse_args():
             sys.exit(1)
     
     if types_arg:
-        normalized = types_arg.lower()
-        types = [t.strip() for t in normalized.split(",")]
+        normalized = types_arg.strip().lower()
         
-        # Reset all flags
-        fetch_commits = False
-        fetch_pull_requests = False
-        fetch_code_reviews = False
+        # Fast path: the dominant single-token case ("commits", "all",
+        # ...) skips the split and per-token strip entirely
+        if "," not in normalized:
+            types = {normalized}
+        else:
+            types = {t.strip() for t in normalized.split(",")}
         
         # Handle special cases
-        if normalized == "all" or "all" in types:
+        if "all" in types:
             fetch_commits = True
             fetch_pull_requests = True
             fetch_code_reviews = True
@@ -61,13 +67,10 @@ def parse_args():
             fetch_commits = True
             fetch_pull_requests = True
         else:
-            # Set flags based on individual types
-            if "commits" in types or "commit" in types:
-                fetch_commits = True
-            if "prs" in types or "pr" in types or "pullrequests" in types:
-                fetch_pull_requests = True
-            if "reviews" in types or "review" in types or "codereviews" in types:
-                fetch_code_reviews = True
+            # Set flags from one set intersection per type
+            fetch_commits = bool(types & _COMMIT_TOKENS)
+            fetch_pull_requests = bool(types & _PR_TOKENS)
+            fetch_code_reviews = bool(types & _REVIEW_TOKENS)
             
             # If no valid types found, default to commits
             if not fetch_commits and not fetch_pull_requests and not fetch_code_reviews:
@@ -76,3 +76,18 @@ CODE_REVIEW_CSV_HEADERS = [
 # Default repository affiliation filter
 DEFAULT_AFFILIATION = "owner,collaborator,organization_member"
 
+# Number of detail fetches (PR details, reviews, commit stats) allowed in
+# flight at once within one repo or search; kept small to stay within
+# GitHub's secondary rate limits
+MAX_CONCURRENT_FETCHES = 5
+
+# Number of repositories fetched concurrently; each repo fetch is an
+# independent I/O-bound task, bounded to respect GitHub rate limits
+MAX_CONCURRENT_REPO_FETCHES = 5
+
+# Size of the HTTPS connection pool kept alive to the GitHub host
+# Sized to cover peak in-flight requests (repo fan-out times per-repo
+# detail fetches) so every concurrent request reuses a warm TLS
+# connection instead of queuing for one or paying a new handshake
+CONNECTION_POOL_SIZE = MAX_CONCURRENT_REPO_FETCHES * MAX_CONCURRENT_FETCHES
+
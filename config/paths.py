@@ -0,0 +1,11 @@
+"""Shared filesystem paths"""
+from pathlib import Path
+
+# Project root (the directory holding cli.py), resolved once at import
+SCRIPT_DIR = Path(__file__).resolve().parent.parent
+
+# Exported CSV files
+EXPORTS_DIR = SCRIPT_DIR / "exports"
+COMMITS_CSV = EXPORTS_DIR / "commits.csv"
+PULL_REQUESTS_CSV = EXPORTS_DIR / "pullRequests.csv"
+CODE_REVIEWS_CSV = EXPORTS_DIR / "codeReviews.csv"
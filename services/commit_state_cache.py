@@ -0,0 +1,75 @@
+"""Persistent cache of committed contribution paths"""
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+# The committed-path set lives beside the repo under .unicon/, keyed by
+# the HEAD it was computed against; a new HEAD invalidates it
+DB_NAME = "commit_cache.db"
+
+
+def _connect(repo_root):
+    """Open (and initialize) the cache database for a repository"""
+    cache_dir = Path(repo_root) / ".unicon"
+    cache_dir.mkdir(exist_ok=True)
+    # The directory sits inside the user's contributions repository, so
+    # it ignores itself; the cache must never show up as untracked or
+    # end up in their history
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n")
+    conn = sqlite3.connect(cache_dir / DB_NAME)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS committed (head TEXT, path TEXT, PRIMARY KEY (head, path))"
+    )
+    return conn
+
+
+def load_committed_paths(repo_root, head):
+    """
+    Load the cached committed-path set computed at a given HEAD
+
+    Args:
+        repo_root: Repository root directory
+        head: Commit SHA the set must match
+
+    Returns:
+        Set of repo-relative paths, or None on a cache miss
+    """
+    try:
+        with closing(_connect(repo_root)) as conn:
+            rows = conn.execute(
+                "SELECT path FROM committed WHERE head = ?", (head,)
+            ).fetchall()
+    except sqlite3.Error:
+        return None
+    if not rows:
+        return None
+    return {row[0] for row in rows}
+
+
+def save_committed_paths(repo_root, head, paths):
+    """
+    Replace the cached committed-path set with one for a new HEAD
+
+    Only the current HEAD's rows are kept, which both invalidates stale
+    entries and caps the database size at one snapshot
+
+    Args:
+        repo_root: Repository root directory
+        head: Commit SHA the set was computed against
+        paths: Iterable of repo-relative paths
+    """
+    try:
+        # closing() releases the connection; the inner "with conn"
+        # commits the transaction (sqlite connections don't close on
+        # context-manager exit by themselves)
+        with closing(_connect(repo_root)) as conn:
+            with conn:
+                conn.execute("DELETE FROM committed")
+                conn.executemany(
+                    "INSERT OR IGNORE INTO committed (head, path) VALUES (?, ?)",
+                    ((head, path) for path in paths),
+                )
+    except sqlite3.Error as error:
+        print(f"  Warning: Could not save commit-state cache: {error}")
@@ -0,0 +1,91 @@
+"""Streaming CSV writer"""
+import csv
+import os
+import queue
+import threading
+
+# Encoded chunks of roughly this size are handed to the writer thread;
+# batches many small row writes into few write() syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Bounded hand-off queue: keeps a few chunks in flight without letting
+# a slow disk balloon memory
+_QUEUE_DEPTH = 8
+
+
+class _QueueSink:
+    """csv.writer target that ships UTF-8 chunks to a writer thread"""
+
+    def __init__(self, chunk_queue):
+        self._queue = chunk_queue
+        self._parts = []
+        self._size = 0
+
+    def write(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= WRITE_BUFFER_SIZE:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            self._queue.put("".join(self._parts).encode("utf-8"))
+            self._parts = []
+            self._size = 0
+
+
+def write_rows(path, headers, rows):
+    """
+    Stream rows to a CSV file one at a time
+
+    Serialization and disk writes run on separate threads: the caller's
+    thread formats and encodes rows while a background thread drains the
+    chunk queue to disk, so encoding overlaps write latency. Peak memory
+    stays at a few chunks instead of the whole document.
+
+    Args:
+        path: Output file path
+        headers: List of column names
+        rows: Iterable of row dictionaries; missing columns become empty
+            strings and extra keys are ignored
+    """
+    chunk_queue = queue.Queue(maxsize=_QUEUE_DEPTH)
+    write_errors = []
+
+    def drain():
+        try:
+            with open(path, "wb") as f:
+                while True:
+                    chunk = chunk_queue.get()
+                    if chunk is None:
+                        break
+                    f.write(chunk)
+
+                # The export is write-once: tell the kernel it can drop
+                # these pages from the cache instead of keeping a large
+                # export resident (no-op where posix_fadvise is
+                # unavailable, e.g. macOS)
+                if hasattr(os, "posix_fadvise"):
+                    f.flush()
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError as error:
+            write_errors.append(error)
+            # Keep draining so the producer never blocks on a full queue
+            while chunk_queue.get() is not None:
+                pass
+
+    writer_thread = threading.Thread(target=drain)
+    writer_thread.start()
+
+    sink = _QueueSink(chunk_queue)
+    writer = csv.DictWriter(sink, fieldnames=headers, restval="", extrasaction="ignore")
+    try:
+        writer.writeheader()
+        writer.writerows(rows)
+        sink.flush()
+    finally:
+        chunk_queue.put(None)
+        writer_thread.join()
+
+    if write_errors:
+        raise write_errors[0]
@@ -1,162 +1,113 @@
 """Service for exporting contributions to CSV"""
-import os
-from pathlib import Path
-from utils.csv_utils import array_to_csv
+import time
+from config.paths import EXPORTS_DIR, COMMITS_CSV, PULL_REQUESTS_CSV, CODE_REVIEWS_CSV
+from services.csv_stream import write_rows
 from config.constants import (
     COMMIT_CSV_HEADERS,
     PULL_REQUEST_CSV_HEADERS,
     CODE_REVIEW_CSV_HEADERS,
 )
 
+# One export configuration per contribution type: (headers, path, label)
+# A single code path means an improvement to the writer applies to all
+# three exports at once
+_EXPORT_CONFIGS = {
+    "commits": (COMMIT_CSV_HEADERS, COMMITS_CSV, "commits"),
+    "pullRequests": (PULL_REQUEST_CSV_HEADERS, PULL_REQUESTS_CSV, "pull requests"),
+    "codeReviews": (CODE_REVIEW_CSV_HEADERS, CODE_REVIEWS_CSV, "code reviews"),
+}
 
-def export_commits_to_csv(commits):
+
+def _export(rows, headers, output_path, label):
     """
-    Export commits to CSV file
-    
+    Export one contribution type to its CSV file
+
     Args:
-        commits: List of commit dictionaries
-    
+        rows: List of contribution dictionaries
+        headers: CSV column names
+        output_path: Destination file path
+        label: Human-readable type name for progress output
+
     Returns:
-        Path to CSV file or None if no commits
+        Path to CSV file or None if no rows
     """
-    if not commits:
+    if not rows:
         return None
-    
-    # Convert to CSV
-    print("\n💾 Converting commits to CSV... ", end="", flush=True)
-    import time
-    csv_start_time = time.time()
-    csv_content = array_to_csv(commits, COMMIT_CSV_HEADERS)
-    csv_time = f"{(time.time() - csv_start_time):.2f}"
-    print(f"✓ ({csv_time}s)")
-    
-    # Write to file
-    print("📝 Writing commits to file... ", end="", flush=True)
+
+    # Stream rows straight to the file; no intermediate CSV string
+    print(f"\n💾 Writing {label} to CSV... ", end="", flush=True)
     write_start_time = time.time()
-    
-    # Get the script directory (parent of services)
-    script_dir = Path(__file__).parent.parent
-    exports_dir = script_dir / "exports"
-    exports_dir.mkdir(exist_ok=True)
-    
-    output_path = exports_dir / "commits.csv"
-    output_path.write_text(csv_content, encoding="utf-8")
-    
+
+    EXPORTS_DIR.mkdir(exist_ok=True)
+    write_rows(output_path, headers, rows)
+
     write_time = f"{(time.time() - write_start_time):.2f}"
-    file_size = f"{(len(csv_content) / 1024):.2f}"
+    file_size = f"{(output_path.stat().st_size / 1024):.2f}"
     print(f"✓ ({write_time}s, {file_size} KB)")
-    
+
     return str(output_path)
 
 
+def export_commits_to_csv(commits):
+    """
+    Export commits to CSV file
+
+    Args:
+        commits: List of commit dictionaries
+
+    Returns:
+        Path to CSV file or None if no commits
+    """
+    return _export(commits, *_EXPORT_CONFIGS["commits"])
+
+
 def export_pull_requests_to_csv(pull_requests):
     """
     Export pull requests to CSV file
-    
+
     Args:
         pull_requests: List of pull request dictionaries
-    
+
     Returns:
         Path to CSV file or None if no pull requests
     """
-    if not pull_requests:
-        return None
-    
-    # Convert to CSV
-    print("\n💾 Converting pull requests to CSV... ", end="", flush=True)
-    import time
-    csv_start_time = time.time()
-    csv_content = array_to_csv(pull_requests, PULL_REQUEST_CSV_HEADERS)
-    csv_time = f"{(time.time() - csv_start_time):.2f}"
-    print(f"✓ ({csv_time}s)")
-    
-    # Write to file
-    print("📝 Writing pull requests to file... ", end="", flush=True)
-    write_start_time = time.time()
-    
-    # Get the script directory (parent of services)
-    script_dir = Path(__file__).parent.parent
-    exports_dir = script_dir / "exports"
-    exports_dir.mkdir(exist_ok=True)
-    
-    output_path = exports_dir / "pullRequests.csv"
-    output_path.write_text(csv_content, encoding="utf-8")
-    
-    write_time = f"{(time.time() - write_start_time):.2f}"
-    file_size = f"{(len(csv_content) / 1024):.2f}"
-    print(f"✓ ({write_time}s, {file_size} KB)")
-    
-    return str(output_path)
+    return _export(pull_requests, *_EXPORT_CONFIGS["pullRequests"])
 
 
 def export_code_reviews_to_csv(code_reviews):
     """
     Export code reviews to CSV file
-    
+
     Args:
         code_reviews: List of code review dictionaries
-    
+
     Returns:
         Path to CSV file or None if no code reviews
     """
-    if not code_reviews:
-        return None
-    
-    # Convert to CSV
-    print("\n💾 Converting code reviews to CSV... ", end="", flush=True)
-    import time
-    csv_start_time = time.time()
-    csv_content = array_to_csv(code_reviews, CODE_REVIEW_CSV_HEADERS)
-    csv_time = f"{(time.time() - csv_start_time):.2f}"
-    print(f"✓ ({csv_time}s)")
-    
-    # Write to file
-    print("📝 Writing code reviews to file... ", end="", flush=True)
-    write_start_time = time.time()
-    
-    # Get the script directory (parent of services)
-    script_dir = Path(__file__).parent.parent
-    exports_dir = script_dir / "exports"
-    exports_dir.mkdir(exist_ok=True)
-    
-    output_path = exports_dir / "codeReviews.csv"
-    output_path.write_text(csv_content, encoding="utf-8")
-    
-    write_time = f"{(time.time() - write_start_time):.2f}"
-    file_size = f"{(len(csv_content) / 1024):.2f}"
-    print(f"✓ ({write_time}s, {file_size} KB)")
-    
-    return str(output_path)
+    return _export(code_reviews, *_EXPORT_CONFIGS["codeReviews"])
 
 
 def export_to_csv(commits, pull_requests, code_reviews):
     """
     Export commits and/or pull requests and/or code reviews to CSV files
-    
+
     Args:
         commits: List of commit dictionaries
         pull_requests: List of pull request dictionaries
         code_reviews: List of code review dictionaries
-    
+
     Returns:
         List of output file paths
     """
     output_paths = []
-    
-    if commits:
-        commits_path = export_commits_to_csv(commits)
-        if commits_path:
-            output_paths.append(commits_path)
-    
-    if pull_requests:
-        prs_path = export_pull_requests_to_csv(pull_requests)
-        if prs_path:
-            output_paths.append(prs_path)
-    
-    if code_reviews:
-        reviews_path = export_code_reviews_to_csv(code_reviews)
-        if reviews_path:
-            output_paths.append(reviews_path)
-    
-    return output_paths
 
+    for key, rows in [
+        ("commits", commits),
+        ("pullRequests", pull_requests),
+        ("codeReviews", code_reviews),
+    ]:
+        path = _export(rows, *_EXPORT_CONFIGS[key])
+        if path:
+            output_paths.append(path)
+
+    return output_paths
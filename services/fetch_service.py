@@ -1,9 +1,40 @@
 """Service for fetching contributions from GitHub"""
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from api.repositories import fetch_user_repos
 from api.commits import fetch_commits
 from api.pull_requests import search_user_pull_requests
 from api.code_reviews import search_user_code_reviews
+from config.constants import MAX_CONCURRENT_REPO_FETCHES
+from utils.progress import print_progress, should_print_progress
+
+def _fetch_threads():
+    """
+    Resolve the repo fan-out width from UNICON_FETCH_THREADS
+
+    The override widens the fan-out on a dedicated token or narrows it
+    when rate limits bite. Parsed at use time so a malformed value only
+    warns and falls back instead of crashing every CLI invocation at
+    import — including ones that never fetch
+
+    Returns:
+        Number of concurrent repo fetches to run
+    """
+    raw = os.environ.get("UNICON_FETCH_THREADS")
+    if not raw:
+        return MAX_CONCURRENT_REPO_FETCHES
+    try:
+        threads = int(raw)
+        if threads < 1:
+            raise ValueError
+        return threads
+    except ValueError:
+        print(
+            f"⚠️  Ignoring invalid UNICON_FETCH_THREADS={raw!r}; "
+            f"using {MAX_CONCURRENT_REPO_FETCHES}"
+        )
+        return MAX_CONCURRENT_REPO_FETCHES
 
 
 def process_repositories(
@@ -47,22 +78,12 @@ def process_repositories(
         fetch_time = f"{(time.time() - repo_start_time):.2f}"
         print(f"✓ Found {len(repos)} repositories ({fetch_time}s)\n")
         
-        # Process repositories with progress
-        for i, repo in enumerate(repos, 1):
-            current = i
-            total = len(repos)
-            percentage = f"{(current / total * 100):.1f}"
-            
-            print(
-                f"[{current}/{total}] ({percentage}%) Processing: {repo['owner']}/{repo['name']} "
-                f"{'(private)' if repo['private'] else ''}... ",
-                end="",
-                flush=True
-            )
-            
+        total = len(repos)
+
+        def fetch_for_repo(numbered_repo):
+            i, repo = numbered_repo
             repo_process_start_time = time.time()
             show_sample = i == 1
-            
             commits = fetch_commits(
                 github_client,
                 repo["owner"],
@@ -71,17 +92,28 @@ def process_repositories(
                 since_date,
                 show_sample
             )
-            
-            repo_time = f"{(time.time() - repo_process_start_time):.2f}"
-            
-            if commits:
-                repos_with_commits += 1
-                print(f"✓ {len(commits)} commits ({repo_time}s)")
-            else:
-                print(f"✓ 0 commits ({repo_time}s)")
-            
-            all_commits.extend(commits)
-            total_repos_processed += 1
+            return i, repo, commits, time.time() - repo_process_start_time
+
+        # Process repositories concurrently; each repo is an independent
+        # fetch, results are consumed (and printed) in submission order
+        with ThreadPoolExecutor(max_workers=_fetch_threads()) as executor:
+            for i, repo, commits, repo_seconds in executor.map(fetch_for_repo, enumerate(repos, 1)):
+                # Progress lines are throttled so large repo lists don't
+                # spend their time writing to stdout
+                if should_print_progress(i, total):
+                    percentage = f"{(i / total * 100):.1f}"
+                    repo_time = f"{repo_seconds:.2f}"
+
+                    print_progress(
+                        f"[{i}/{total}] ({percentage}%) Processed: {repo['owner']}/{repo['name']} "
+                        f"{'(private) ' if repo['private'] else ''}✓ {len(commits)} commits ({repo_time}s)"
+                    )
+
+                if commits:
+                    repos_with_commits += 1
+
+                all_commits.extend(commits)
+                total_repos_processed += 1
     
     # Fetch PRs using the Search API (if enabled)
     # This finds PRs across ALL repos, not just the user's repo list
@@ -3,35 +3,57 @@ import os
 import re
 import subprocess
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+from services import commit_state_cache
+from services.git_fast_import import FAST_IMPORT_THRESHOLD, commit_files_fast_import
+from utils.progress import print_progress, should_print_progress
+
+# Captures the date components of YYYY-MM-DDTHH-MM-SS-{sha}.md filenames,
+# compiled once at import
+_FILENAME_DATE_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})T(\d{2})-(\d{2})-(\d{2})-")
+
+# Sort key for files whose name carries no parseable date
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def parse_datetime_from_filename(filename):
+    """
+    Parse date from filename: YYYY-MM-DDTHH-MM-SS-{sha}.md
+
+    The regex captures the six date components directly, so the datetime
+    is built in one pass without intermediate string reformatting
+
+    Args:
+        filename: Markdown filename
+
+    Returns:
+        Timezone-aware datetime (UTC) or None if invalid
+    """
+    match = _FILENAME_DATE_PATTERN.match(filename)
+    if not match:
+        return None
+    try:
+        return datetime(*map(int, match.groups()), tzinfo=timezone.utc)
+    except ValueError:
+        # Digits matched the pattern but are out of range (month 13,
+        # hour 25, ...); treat like any other invalid date
+        return None
 
 
 def parse_date_from_filename(filename):
     """
     Parse date from filename: YYYY-MM-DDTHH-MM-SS-{sha}.md
     Returns ISO 8601 format date string
-    
+
     Args:
         filename: Markdown filename
-    
+
     Returns:
         ISO 8601 date string or None if invalid
     """
-    # Extract date part: YYYY-MM-DDTHH-MM-SS
-    match = re.match(r"^(\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2})-", filename)
-    if not match:
-        return None
-    
-    # Convert to ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ
-    date_str = match.group(1).replace("-", ":", 3).replace(":", "-", 2)
-    # Replace the time separators (after T) with colons
-    parts = date_str.split("T")
-    if len(parts) == 2:
-        date_part = parts[0]
-        time_part = parts[1].replace("-", ":")
-        date_str = f"{date_part}T{time_part}Z"
-    
-    return date_str
+    date = parse_datetime_from_filename(filename)
+    return date.strftime("%Y-%m-%dT%H:%M:%SZ") if date else None
 
 
 def format_date_for_git(iso_date):
@@ -60,61 +82,144 @@ def format_date_for_git(iso_date):
         return iso_date
 
 
-def get_markdown_files(directory):
+def get_markdown_files(directory, repo_root=None):
     """
     Get all markdown files from a directory
-    
+
     Args:
         directory: Directory path
-    
+        repo_root: Optional repository root; when given, each entry also
+            carries its repo-relative path
+
     Returns:
-        List of dicts with filename and filepath
+        List of dicts with filename, filepath (and relativePath)
     """
-    directory = Path(directory)
-    if not directory.exists():
+    # os.scandir exposes name/path (and file type on most platforms)
+    # straight from the directory read, avoiding a stat per entry
+    try:
+        it = os.scandir(directory)
+    except FileNotFoundError:
         return []
-    
-    files = []
-    for file in directory.glob("*.md"):
-        if file.name != "README.md":
-            files.append({
-                "filename": file.name,
-                "filepath": str(file),
-            })
-    
-    return files
 
+    with it:
+        files = []
+        for entry in it:
+            if (
+                entry.name.endswith(".md")
+                and entry.name != "README.md"
+                and entry.is_file(follow_symlinks=False)
+            ):
+                file = {
+                    "filename": entry.name,
+                    "filepath": entry.path,
+                }
+                if repo_root is not None:
+                    file["relativePath"] = os.path.relpath(entry.path, repo_root)
+                files.append(file)
+        return files
 
-def commit_file(filepath, relative_path, date, repo_root):
+
+def get_head_sha(repo_root):
     """
-    Commit a single file with its original timestamp
-    
+    Get the current HEAD commit SHA
+
     Args:
-        filepath: Full path to file
-        relative_path: Relative path from repo root
-        date: ISO date string
+        repo_root: Repository root directory
+
+    Returns:
+        SHA string, or None in an empty repository
+    """
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def get_committed_paths(repo_root):
+    """
+    Get the set of file paths already present in git history
+
+    One `git log --name-only` pass replaces a per-file `git log -- <path>`
+    subprocess, so the already-committed check is an O(1) set lookup
+    instead of a fork+exec and repo scan per file
+
+    Args:
+        repo_root: Repository root directory
+
+    Returns:
+        Set of repo-relative paths that appear in any commit
+    """
+    result = subprocess.run(
+        ["git", "log", "--name-only", "--pretty=format:", "HEAD"],
+        cwd=repo_root,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        # Empty repository (no HEAD yet): nothing is committed
+        return set()
+    return set(filter(None, result.stdout.splitlines()))
+
+
+def stage_files(relative_paths, repo_root):
+    """
+    Stage a batch of files with a single git add invocation
+
+    Paths are piped over stdin (--pathspec-from-file=-) so arbitrarily
+    large batches never hit the OS argument-length limit
+
+    Args:
+        relative_paths: Repo-relative paths to stage
         repo_root: Repository root directory
     """
-    git_date = format_date_for_git(date)
-    commit_message = f"Add contribution: {Path(filepath).name}"
-    
-    # Stage the file
     subprocess.run(
-        ["git", "add", relative_path],
+        ["git", "add", "--pathspec-from-file=-"],
+        input="\n".join(relative_paths),
         cwd=repo_root,
         check=True,
         capture_output=True,
+        text=True,
     )
-    
+
+
+def commit_file(filename, relative_path, date, repo_root, base_env=None):
+    """
+    Commit a single (already staged) file with its original timestamp
+
+    Args:
+        filename: File name, used in the commit message
+        relative_path: Relative path from repo root
+        date: datetime or ISO date string
+        repo_root: Repository root directory
+        base_env: Environment dict to extend; the caller can snapshot
+            os.environ once per batch instead of per file
+    """
+    # Dates parsed from filenames arrive as datetimes and format
+    # directly; ISO strings still go through format_date_for_git
+    if isinstance(date, datetime):
+        git_date = date.strftime("%Y-%m-%d %H:%M:%S +0000")
+    else:
+        git_date = format_date_for_git(date)
+    commit_message = f"Add contribution: {filename}"
+
     # Commit with original date
+    if base_env is None:
+        base_env = os.environ
     env = {
-        **dict(os.environ),
+        **base_env,
         "GIT_AUTHOR_DATE": git_date,
         "GIT_COMMITTER_DATE": git_date,
     }
-    
+
+    # --only restricts the commit to this path, so the rest of the
+    # batch-staged files stay staged for their own commits
     subprocess.run(
-        ["git", "commit", "-m", commit_message],
+        ["git", "commit", "--only", relative_path, "-m", commit_message],
         env=env,
         cwd=repo_root,
         check=True,
@@ -144,96 +249,129 @@ def commit_contributions(commit_types=None):
     
     all_files = []
     
-    # Get commit files
+    # Get commit files (relative paths computed during the directory scan)
     if commit_types.get("commits"):
-        commit_files = get_markdown_files(commits_dir)
-        all_files.extend([
-            {
-                **file,
-                "type": "commit",
-                "relativePath": str(Path(file["filepath"]).relative_to(repo_root)),
-            }
-            for file in commit_files
-        ])
-    
+        commit_files = get_markdown_files(commits_dir, repo_root)
+        for file in commit_files:
+            file["type"] = "commit"
+        all_files.extend(commit_files)
+
     # Get pull request files
     if commit_types.get("pullRequests"):
-        pr_files = get_markdown_files(prs_dir)
-        all_files.extend([
-            {
-                **file,
-                "type": "pull-request",
-                "relativePath": str(Path(file["filepath"]).relative_to(repo_root)),
-            }
-            for file in pr_files
-        ])
-    
+        pr_files = get_markdown_files(prs_dir, repo_root)
+        for file in pr_files:
+            file["type"] = "pull-request"
+        all_files.extend(pr_files)
+
     # Get code review files
     if commit_types.get("codeReviews"):
-        review_files = get_markdown_files(reviews_dir)
-        all_files.extend([
-            {
-                **file,
-                "type": "code-review",
-                "relativePath": str(Path(file["filepath"]).relative_to(repo_root)),
-            }
-            for file in review_files
-        ])
+        review_files = get_markdown_files(reviews_dir, repo_root)
+        for file in review_files:
+            file["type"] = "code-review"
+        all_files.extend(review_files)
     
     if not all_files:
         print("⚠️  No contribution files found to commit")
         return {"committed": 0, "skipped": 0, "errors": 0}
     
+    # Parse each filename exactly once; the sort key and the commit loop
+    # both reuse the stored datetime
+    for file in all_files:
+        file["date"] = parse_datetime_from_filename(file["filename"])
+
     # Sort by date to commit in chronological order
-    def get_date_key(file):
-        date = parse_date_from_filename(file["filename"])
-        return datetime.fromisoformat(date.replace("Z", "+00:00")) if date else datetime.min
-    
-    all_files.sort(key=get_date_key)
+    all_files.sort(key=lambda file: file["date"] or _EPOCH)
     
     print(f"\n📝 Found {len(all_files)} contribution file(s) to commit\n")
     
     committed = 0
     skipped = 0
     errors = 0
-    
+
+    # Load the committed-path set: served from the on-disk cache when
+    # HEAD is unchanged since the last run, otherwise rebuilt with one
+    # git log pass so the per-file skip check stays a set lookup
+    head = get_head_sha(repo_root)
+    committed_paths = None
+    if head:
+        committed_paths = commit_state_cache.load_committed_paths(repo_root, head)
+    if committed_paths is None:
+        committed_paths = get_committed_paths(repo_root)
+        if head:
+            commit_state_cache.save_committed_paths(repo_root, head, committed_paths)
+
+    # Filter to the files that actually need committing
+    total = len(all_files)
+    pending = []
     for i, file in enumerate(all_files, 1):
-        current = i
-        total = len(all_files)
-        percentage = f"{(current / total * 100):.1f}"
-        
-        date = parse_date_from_filename(file["filename"])
+        date = file["date"]
         if not date:
-            print(f"⚠️  [{current}/{total}] Skipping {file['filename']}: Invalid date format")
+            print(f"⚠️  [{i}/{total}] Skipping {file['filename']}: Invalid date format")
             skipped += 1
             continue
-        
-        # Check if file is already committed
+
+        # Check if file is already committed; progress lines are
+        # throttled so long skip runs don't flood stdout
+        if file["relativePath"] in committed_paths:
+            skipped += 1
+            if should_print_progress(i, total):
+                percentage = f"{(i / total * 100):.1f}"
+                print_progress(f"[{i}/{total}] ({percentage}%) Skipping: {file['filename']} (already committed)... ⏭️")
+            continue
+
+        pending.append((i, file, date))
+
+    repo_root_str = str(repo_root)
+
+    # Large batches go through one long-lived git fast-import process
+    # instead of a git commit per file; the branch ref only moves when
+    # the whole stream succeeds, so failure falls back cleanly
+    if len(pending) > FAST_IMPORT_THRESHOLD:
+        print(f"⚡ Batch-committing {len(pending)} file(s) via git fast-import... ", end="", flush=True)
+        batch_committed = commit_files_fast_import(
+            [(file, date) for _i, file, date in pending], repo_root_str
+        )
+        if batch_committed is None:
+            print("unavailable, falling back to per-file commits")
+        else:
+            print("✓")
+            committed = batch_committed
+            for _i, file, _date in pending:
+                committed_paths.add(file["relativePath"])
+            pending = []
+
+    # Stage everything in one git add; each file still gets its own
+    # commit below because commit dates are per-file
+    if pending:
         try:
-            result = subprocess.run(
-                ["git", "log", "--oneline", "--", file["relativePath"]],
-                cwd=repo_root,
-                capture_output=True,
-                text=True,
-            )
-            if result.stdout.strip():
-                print(f"[{current}/{total}] ({percentage}%) Skipping: {file['filename']} (already committed)... ⏭️")
-                skipped += 1
-                continue
-        except:
-            # File not in git history, proceed
-            pass
-        
+            stage_files([file["relativePath"] for _i, file, _date in pending], repo_root)
+        except Exception as error:
+            print(f"❌ Error staging files: {error}")
+            return {"committed": 0, "skipped": skipped, "errors": len(pending)}
+
+    # Snapshot the environment once for the whole batch; commit_file
+    # only layers the two git date variables on top
+    base_env = os.environ.copy()
+
+    for i, file, date in pending:
         try:
-            print(f"[{current}/{total}] ({percentage}%) Committing: {file['filename']} ({date})... ", end="", flush=True)
-            commit_file(file["filepath"], file["relativePath"], date, str(repo_root))
+            commit_file(file["filename"], file["relativePath"], date, repo_root_str, base_env)
             committed += 1
-            print("✓")
+            committed_paths.add(file["relativePath"])
+            # Errors always print; success lines are throttled
+            if should_print_progress(i, total):
+                percentage = f"{(i / total * 100):.1f}"
+                print_progress(f"[{i}/{total}] ({percentage}%) Committed: {file['filename']} ({date:%Y-%m-%dT%H:%M:%SZ}) ✓")
         except Exception as error:
             errors += 1
-            print("✗")
-            print(f"   Error: {error}")
+            print(f"✗ [{i}/{total}] Error committing {file['filename']}: {error}")
     
+    # Re-key the cache to the new HEAD so the next run skips the scan
+    if committed > 0:
+        new_head = get_head_sha(repo_root)
+        if new_head:
+            commit_state_cache.save_committed_paths(repo_root, new_head, committed_paths)
+
     print(f"\n{'═' * 60}")
     print("📊 Commit Summary:")
     print(f"   Total files: {len(all_files)}")
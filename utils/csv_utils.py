@@ -2,51 +2,76 @@
 import csv
 import io
 
+# Characters that force a field to be quoted
+_CSV_SPECIALS = ',"\n'
+
 
 def escape_csv_field(field):
     """
     Escape CSV field (handle quotes and commas)
-    
+
     Args:
         field: Field value to escape
-    
+
     Returns:
         Escaped field string
     """
     if field is None:
         return ""
-    
+
     str_field = str(field)
-    # If field contains comma, quote, or newline, wrap in quotes and escape quotes
-    if "," in str_field or '"' in str_field or "\n" in str_field:
-        return f'"{str_field.replace('"', '""')}"'
+    # Single short-circuiting scan instead of one full pass per special
+    # character; only fields that actually need quoting pay for replace
+    if any(c in str_field for c in _CSV_SPECIALS):
+        return '"' + str_field.replace('"', '""') + '"'
     return str_field
 
 
+def write_csv_to_stream(data, headers, out):
+    """
+    Write objects as CSV rows to an already-open text stream
+
+    Writing straight to the destination keeps peak memory at one row,
+    whatever the export size; callers that stream to disk should open
+    the file with a large buffer, e.g. open(path, "w", newline="",
+    buffering=1 << 20)
+
+    Args:
+        data: Iterable of dictionaries (lists and generators both work;
+            rows are consumed one at a time, never materialized)
+        headers: List of header names
+        out: Writable text stream
+    """
+    writer = csv.writer(out)
+
+    # Write headers
+    writer.writerow(headers)
+
+    # csv.writer already quotes and escapes in C (QUOTE_MINIMAL) and
+    # writes None as an empty field, so rows go straight through;
+    # pre-escaping here would double-quote
+    writer.writerows(
+        [row.get(header) for header in headers] for row in data
+    )
+
+
 def array_to_csv(data, headers):
     """
     Convert array of objects to CSV
-    
+
+    Thin wrapper over write_csv_to_stream for callers that want the CSV
+    as a string; large exports should stream to a file instead
+
     Args:
-        data: List of dictionaries
+        data: Iterable of dictionaries
         headers: List of header names
-    
+
     Returns:
         CSV string
     """
     if not data:
         return ",".join(headers)
-    
+
     output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Write headers
-    writer.writerow(headers)
-    
-    # Write data rows
-    for row in data:
-        values = [escape_csv_field(row.get(header, "")) for header in headers]
-        writer.writerow(values)
-    
+    write_csv_to_stream(data, headers, output)
     return output.getvalue()
-
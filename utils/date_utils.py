@@ -2,6 +2,25 @@
 import re
 from datetime import datetime
 
+# YYYY-MM-DDTHH:MM:SSZ, compiled once at import instead of per call
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+
+
+def format_iso_utc(dt):
+    """
+    Format a datetime as YYYY-MM-DDTHH:MM:SSZ
+
+    Single strftime call instead of isoformat() plus string surgery;
+    GitHub timestamps are always UTC
+
+    Args:
+        dt: datetime object (or None)
+
+    Returns:
+        ISO 8601 "Z" string, or "" if dt is None
+    """
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ") if dt else ""
+
 
 def validate_date(date_str):
     """
@@ -20,8 +39,7 @@ def validate_date(date_str):
         return None
     
     # Check format: YYYY-MM-DDTHH:MM:SSZ
-    date_regex = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$"
-    if not re.match(date_regex, date_str):
+    if not _DATE_PATTERN.match(date_str):
         raise ValueError(
             f"Invalid date format. Expected YYYY-MM-DDTHH:MM:SSZ (e.g., 2024-01-01T00:00:00Z), got: {date_str}"
         )
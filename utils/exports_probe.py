@@ -0,0 +1,26 @@
+"""Filesystem probe for exported CSV files"""
+import os
+
+
+def probe_exports(exports_dir):
+    """
+    Check which contribution CSV exports exist with one directory read
+
+    A single os.listdir replaces three per-file stat calls, so probing
+    costs one metadata round trip regardless of filesystem latency
+
+    Args:
+        exports_dir: Path to the exports/ directory
+
+    Returns:
+        Tuple of (has_commits, has_prs, has_reviews)
+    """
+    try:
+        names = set(os.listdir(exports_dir))
+    except OSError:
+        names = set()
+    return (
+        "commits.csv" in names,
+        "pullRequests.csv" in names,
+        "codeReviews.csv" in names,
+    )
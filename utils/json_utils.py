@@ -0,0 +1,16 @@
+"""JSON serialization helpers"""
+
+# orjson serializes nested dicts several times faster than stdlib json;
+# it is optional, so fall back to json when it is not installed
+try:
+    import orjson
+
+    def dumps_pretty(obj):
+        """Serialize an object to indented JSON for display"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str).decode("utf-8")
+except ImportError:
+    import json
+
+    def dumps_pretty(obj):
+        """Serialize an object to indented JSON for display"""
+        return json.dumps(obj, indent=2, default=str)
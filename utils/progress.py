@@ -0,0 +1,57 @@
+"""Console progress helpers"""
+import sys
+import time
+
+# Print at most one progress line per this many items; per-item prints
+# are synchronous stdout syscalls and dominate tight loops. Non-TTY
+# output (CI, redirects) gets even fewer lines
+PROGRESS_EVERY = 100 if sys.stdout.isatty() else 1000
+
+# A progress line also goes out when this much wall time has passed
+# since the previous one, so slow loops (seconds per item) stay live
+# between every-Nth reports instead of going silent
+PROGRESS_MIN_INTERVAL = 2.0
+
+# Monotonic timestamp of the last emitted line; a list so it can be
+# rebound without a global statement. Concurrent callers may race on
+# it, which at worst costs one extra line
+_last_print_time = [0.0]
+
+
+def should_print_progress(current, total, every=None):
+    """
+    Decide whether to emit a progress line for this item
+
+    The first item, every Nth item, and the last item all report, so
+    short runs still show output and long runs stay readable; when
+    items are slow, elapsed time since the last line forces one through
+    so the run never looks stalled
+
+    Args:
+        current: 1-based item index
+        total: Total number of items
+        every: Optional override for the reporting interval
+
+    Returns:
+        True when a progress line should be printed
+    """
+    if every is None:
+        every = PROGRESS_EVERY
+    if current == 1 or current == total or current % every == 0:
+        return True
+    return time.monotonic() - _last_print_time[0] >= PROGRESS_MIN_INTERVAL
+
+
+def print_progress(line):
+    """
+    Emit one progress line with a single buffered stdout write
+
+    print() issues two writes per line (text, then the newline); joining
+    them halves the calls into the io layer, and the interpreter's own
+    line/block buffering decides when to flush
+
+    Args:
+        line: Progress line to emit (without trailing newline)
+    """
+    _last_print_time[0] = time.monotonic()
+    sys.stdout.write(line + "\n")
@@ -0,0 +1,17 @@
+"""Text utilities"""
+
+# Maps newline characters to spaces in a single C-level pass
+_NEWLINE_TABLE = str.maketrans({"\n": " ", "\r": " "})
+
+
+def to_single_line(text):
+    """
+    Collapse text to a single line (newlines become spaces)
+
+    Args:
+        text: String to sanitize (None is treated as empty)
+
+    Returns:
+        Single-line string with surrounding whitespace stripped
+    """
+    return (text or "").translate(_NEWLINE_TABLE).strip()
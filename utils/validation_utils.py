@@ -2,6 +2,11 @@
 import os
 from .date_utils import validate_date
 
+# Hash lookups for the membership checks; the tuple keeps a stable
+# order for error messages
+_VALID_AFFILIATIONS = ("owner", "collaborator", "organization_member")
+_VALID_AFFILIATION_SET = frozenset(_VALID_AFFILIATIONS)
+
 
 def validate_affiliation(affiliation_str):
     """
@@ -19,15 +24,14 @@ def validate_affiliation(affiliation_str):
     if not affiliation_str:
         return None
     
-    valid_values = ["owner", "collaborator", "organization_member"]
     affiliations = [a.strip() for a in affiliation_str.split(",")]
-    
+
     for aff in affiliations:
-        if aff not in valid_values:
+        if aff not in _VALID_AFFILIATION_SET:
             raise ValueError(
-                f"Invalid affiliation: {aff}. Valid values are: {', '.join(valid_values)}"
+                f"Invalid affiliation: {aff}. Valid values are: {', '.join(_VALID_AFFILIATIONS)}"
             )
-    
+
     return ",".join(affiliations)
 
 
@@ -38,9 +42,12 @@ def validate_environment():
     Raises:
         ValueError: If required environment variables are missing
     """
-    if not os.getenv("GITHUB_TOKEN"):
+    # One environ.get per variable instead of going through the
+    # os.getenv wrapper layer
+    env = os.environ
+    if not env.get("GITHUB_TOKEN"):
         raise ValueError("GITHUB_TOKEN is required. Create a .env file with your token.")
-    
-    if not os.getenv("GITHUB_USERNAME"):
+
+    if not env.get("GITHUB_USERNAME"):
         raise ValueError("GITHUB_USERNAME is required. Add it to your .env file.")
 